@@ -1,2 +1,10 @@
 from .client import Client
-from .service_request import ServiceRequest
\ No newline at end of file
+from .service_request import ServiceRequest
+
+
+def __getattr__(name):
+    # AsyncClient pulls in aiohttp, so it is only imported the first time it is asked for
+    if name == 'AsyncClient':
+        from .async_client import AsyncClient
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,212 @@
+import asyncio
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, Literal, Mapping
+import orjson
+from logging import getLogger
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, see the `async` extra
+    aiohttp = None
+
+from pysysaid.client import (IDEMPOTENT_METHODS, JSON_HEADERS, SR_LIST_PARAMS, SR_SEARCH_PARAMS, VALID_METHODS,
+                             _BaseClient, _id_chunks, _info_payload, _pack, _resolve_base_url, _resolve_cookie_path,
+                             _sr_list_result)
+from pysysaid.service_request import ServiceRequest, SRAttribute
+
+logger = getLogger(__name__)
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# a POST may already have been processed when a gateway error comes back, so only refused requests are resent
+THROTTLE_STATUSES = frozenset({429})
+
+
+def _retry_delay(retry_after, attempt, backoff_factor, backoff_max=120):
+    """
+    Seconds to wait before retry number `attempt` (0-based). A Retry-After header, in seconds or as an HTTP date, wins;
+    otherwise exponential backoff with up to a second of jitter, matching the sync client's retry policy.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    if attempt == 0:
+        return 0
+    return min(backoff_max, backoff_factor * 2 ** attempt) + random.uniform(0, 1)
+
+
+class AsyncClient(_BaseClient):
+    """
+    asyncio counterpart to `Client` built on aiohttp. Shares the cookie file with `Client`, so either can log in for
+    the other. Use as an async context manager so the underlying connection pool is closed:
+
+        async with AsyncClient(username, password, environment_name=env) as client:
+            srs = await client.get_srs_bulk([1, 2, 3])
+    """
+    def __init__(self, username, password, environment_name=None, base_url=None, cookie_dir='.', cookie_file_name=None,
+                 limit=32):
+        if aiohttp is None:
+            raise ImportError('AsyncClient requires aiohttp, install with `python -m pip install pySysAid[async]`')
+
+        self.base_url = _resolve_base_url(environment_name, base_url)
+        super().__init__(username, password, _resolve_cookie_path(cookie_dir, username, cookie_file_name))
+        self.limit = limit
+        self.cookies = self._stored_cookies()
+        self._session = None
+        self._login_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        # aiohttp sessions must be created inside a running event loop, so this is deferred until the first request
+        if self._session is None:
+            # unsafe=True keeps cookies from on-premise instances addressed by IP, which aiohttp drops by default
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.limit),
+                                                  cookie_jar=aiohttp.CookieJar(unsafe=True),
+                                                  cookies=self.cookies,
+                                                  headers=JSON_HEADERS)
+        return self._session
+
+    async def _send(self, method, url, params=None, data=None, retries=3, backoff_factor=0.5):
+        """
+        Sends a request, retrying throttled (429) responses, and gateway (502-504) responses for idempotent methods only.
+        Returns the released response together with its body.
+        """
+        session = self._get_session()
+        retry_statuses = RETRY_STATUSES if method in IDEMPOTENT_METHODS else THROTTLE_STATUSES
+        for attempt in range(retries + 1):
+            async with session.request(method, url, params=params, data=data) as response:
+                content = await response.read()
+            if response.status not in retry_statuses or attempt == retries:
+                return response, content
+            delay = _retry_delay(response.headers.get('Retry-After'), attempt, backoff_factor)
+            logger.info(f'{method} {url} returned {response.status}, retrying in {delay:.1f}s')
+            await asyncio.sleep(delay)
+
+    async def login(self):
+        session = self._get_session()
+        # SysAid only allows 2 logins per 5 minutes, so login gets the same long retry budget as in Client
+        response, _ = await self._send('POST', f"{self.base_url}login", data=self._login_payload, retries=8,
+                                       backoff_factor=2)
+        response.raise_for_status()
+        self.cookies = {cookie.key: cookie.value for cookie in session.cookie_jar}
+        self._logged_in(self.cookies)
+
+    async def make_request(self, method, endpoint, params=None, body=None, retry=False):
+        """
+        Issues a request given the parameters. Will attempt 1 retry if a 401 response (UnAuthorized)
+        after trying to log in again. Any other failure raises `aiohttp.ClientResponseError`.
+        """
+        http_method = method.upper()
+        if http_method not in VALID_METHODS:
+            raise ValueError(f'Unknown method: {method}')
+        if isinstance(body, (dict, list)):
+            body = orjson.dumps(body)
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+
+        if not self.cookies and not retry:
+            async with self._login_lock:
+                if not self.cookies:
+                    await self.login()
+        logins = self._logins
+
+        response, content = await self._send(http_method, f"{self.base_url}{endpoint}", params=params, data=body)
+        status = response.status
+
+        if status == 200:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content.decode('utf-8', errors='replace')
+        if status == 401 and not retry:
+            async with self._login_lock:
+                if self._logins == logins:
+                    await self.login()
+            return await self.make_request(method, endpoint, params=params, body=body, retry=True)
+        raise aiohttp.ClientResponseError(response.request_info, response.history, status=status,
+                                          message=f'SysAid API error {status}: {content[:512]!r}',
+                                          headers=response.headers)
+
+    async def get_sr(self, sr_id, format: Literal['dict', 'object'] = 'object') -> ServiceRequest|dict|None:
+        resp = await self.make_request('get', f'sr/{sr_id}')
+        if isinstance(resp, list) and len(resp):
+            sr = resp[0]
+            if format == 'object':
+                return ServiceRequest.from_response(sr)
+            return sr
+
+    async def get_sr_list(self, view=None, fields=None, ids=None, type=None, offset=None, limit=None, filters=None,
+                          sort=None, dir=None, format: Literal['dict', 'object'] = 'object') -> List[ServiceRequest|dict]|None:
+        params = _pack(SR_LIST_PARAMS, (view, fields, ids, type, offset, limit, filters, sort, dir))
+        resp = await self.make_request('get', 'sr', params=params)
+        return _sr_list_result(resp, format)
+
+    async def search_srs(self, query=None, view=None, fields=None, type=None, offset=None, limit=None, filters=None,
+                         sort=None, dir=None, format: Literal['dict', 'object'] = 'object') -> List[ServiceRequest|dict]|None:
+        params = _pack(SR_SEARCH_PARAMS, (query, view, fields, type, offset, limit, filters, sort, dir))
+        resp = await self.make_request('get', 'sr/search', params=params)
+        return _sr_list_result(resp, format)
+
+    async def get_srs_bulk(self, ids: Iterable, format: Literal['dict', 'object'] = 'object') -> List[ServiceRequest|dict|None]:
+        """
+        Fetches many SRs concurrently, returned in the same order as `ids`. Concurrency is bounded by `limit`.
+        """
+        if not self.cookies:
+            # log in once up front rather than letting every concurrent request race to do it
+            await self.login()
+        return await asyncio.gather(*[self.get_sr(sr_id, format=format) for sr_id in ids])
+
+    async def update_sr(self, id, info: List[dict[str, Any]|SRAttribute]):
+        payload = {
+            'id': id,
+            'info': _info_payload(info)
+        }
+        return await self.make_request('put', f'sr/{id}', body=payload)
+
+    async def update_srs_bulk(self, updates: Mapping[Any, List[dict[str, Any]|SRAttribute]], concurrency=8) -> dict:
+        """
+        Applies many SR updates concurrently, keyed by SR id with the same `info` lists `update_sr` takes. At most
+        `concurrency` requests are in flight at once. Returns the responses keyed by SR id.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def update(sr_id, info):
+            async with semaphore:
+                return await self.update_sr(sr_id, info)
+
+        if not self.cookies:
+            await self.login()
+        ids = list(updates)
+        results = await asyncio.gather(*[update(sr_id, updates[sr_id]) for sr_id in ids])
+        return dict(zip(ids, results))
+
+    async def delete_sr(self, ids, chunk_size=100, concurrency=8) -> list:
+        """
+        Deletes one or more SRs, splitting long id lists into requests of `chunk_size` ids that run concurrently, at
+        most `concurrency` at a time. Returns one response per request, in order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete(chunk):
+            async with semaphore:
+                return await self.make_request('delete', 'sr', params={'ids': chunk})
+
+        if not self.cookies:
+            await self.login()
+        return await asyncio.gather(*[delete(chunk) for chunk in _id_chunks(ids, chunk_size)])
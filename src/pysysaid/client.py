@@ -1,143 +1,475 @@
 import os
+import random
+import tempfile
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Literal
 import requests
-import json
-import time
-from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import orjson
-import re
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # optional, see the `upload` extra; attachments are buffered in memory without it
+    MultipartEncoder = None
 from logging import getLogger
 
-from pysysaid.service_request import ServiceRequest
+from pysysaid.service_request import ServiceRequest, SRAttribute
 
 logger = getLogger(__name__)
 
-PROTOCOL_RE_PATTERN = r'^https?://'
-ENDPOINT_PARAM_IGNORE = ['self', 'format', 'info']
+_PROTOCOL_PREFIXES = ('http://', 'https://')
+SR_LIST_PARAMS = ('view', 'fields', 'ids', 'type', 'offset', 'limit', 'filters', 'sort', 'dir')
+SR_SEARCH_PARAMS = ('query', 'view', 'fields', 'type', 'offset', 'limit', 'filters', 'sort', 'dir')
+SR_TEMPLATE_PARAMS = ('view', 'fields', 'type', 'template_id')
+USER_LIST_PARAMS = ('view', 'fields', 'type', 'offset', 'limit')
+VALID_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+# methods safe to resend after a gateway error; a POST may already have been processed (creating an SR, sending mail)
+IDEMPOTENT_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
+JSON_HEADERS = {'Content-Type': 'application/json'}
+SR_TYPES = frozenset({'incident', 'request', 'problem', 'change', 'all'})
+
+# cookies from the last successful login per cookie file, so clients created later in the same process skip reading it
+_cookie_cache = {}
+
 
-class Client:
+class _JitteredRetry(Retry):
     """
-    Simple client that logs in, stores the necessary cookies, and uses those cookies to make requests against the API.
+    Exponential backoff with up to a second of random jitter added, so clients throttled at the same moment don't all
+    retry in lockstep. A Retry-After header from the server still takes precedence.
+
+    A 429 means the request was refused rather than processed, so it is retried whatever the method; everything else
+    is limited to `allowed_methods`.
     """
-    def __init__(self, username, password, environment_name=None, base_url=None, cookie_dir='.', cookie_file_name=None):
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if status_code == 429 and self.status_forcelist and 429 in self.status_forcelist:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return backoff + random.uniform(0, 1)
+
+
+class _RewindableUpload:
+    """
+    Streams a file as a multipart body (via requests-toolbelt's MultipartEncoder) that can be sent again from the
+    start. urllib3 rewinds bodies with tell/seek before a retry and `_send` does the same after a re-login; a plain
+    encoder can't be rewound, so a retry would go out with an empty file part.
+    """
+    __slots__ = ('_name', '_file', '_encoder', '_sent', 'content_type', 'len')
+
+    def __init__(self, name, file):
+        self._name = name
+        self._file = file
+        self._encoder = None
+        self.seek(0)
+        self.content_type = self._encoder.content_type
+        self.len = self._encoder.len
+
+    def read(self, size=-1):
+        chunk = self._encoder.read(size)
+        self._sent += len(chunk)
+        return chunk
+
+    def tell(self):
+        return self._sent
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if offset or whence != os.SEEK_SET:
+            raise ValueError('upload bodies can only be rewound to the start')
+        self._file.seek(0)
+        # keep the boundary, it is already in the request's Content-Type header
+        boundary = self._encoder.boundary_value if self._encoder else None
+        self._encoder = MultipartEncoder(fields={'file': (self._name, self._file, 'application/octet-stream')},
+                                         boundary=boundary)
+        self._sent = 0
+        return 0
+
+
+def _rewind(body, files):
+    """
+    Moves streamed request bodies and file handles back to the start so a resent request carries them in full.
+    """
+    streams = [body]
+    if files:
+        streams.extend(value[1] if isinstance(value, tuple) else value for value in files.values())
+    for stream in streams:
+        seek = getattr(stream, 'seek', None)
+        if seek is not None:
+            seek(0)
+
+
+def _resolve_base_url(environment_name=None, base_url=None):
+    """
+    Builds the API root from either a SysAid cloud environment name or a full base url.
+    """
+    if (environment_name is None and base_url is None) or (environment_name and base_url):
+        raise ValueError('Must provide either environment_name or base_url, but not both')
+
+    if environment_name:
+        return f"https://{environment_name}.sysaidit.com/api/v1/"
+
+    if not base_url.startswith(_PROTOCOL_PREFIXES):
+        raise ValueError('base_url must include the http protocol (http:// or https://)')
+    return f"{base_url.strip('/')}/api/v1/"
+
+
+def _resolve_cookie_path(cookie_dir, username, cookie_file_name=None):
+    if not os.path.isdir(cookie_dir):
+        logger.warning('cookie_dir not found, creating...')
+        os.makedirs(cookie_dir)
+        logger.info('successfully created cookie directory')
+
+    if cookie_file_name:
+        return os.path.join(cookie_dir, cookie_file_name)
+    return os.path.join(cookie_dir, f"{username}_cookies.json")
+
+
+def _read_cookies(path):
+    try:
+        with open(path, "rb") as file:
+            return orjson.loads(file.read())
+    except FileNotFoundError:
+        return None
+
+
+def _write_cookies(path, cookies):
+    """
+    Writes the cookie file atomically (temp file + rename) so a crash can't leave it half-written, and skips the write
+    entirely when the contents haven't changed.
+    """
+    data = orjson.dumps(cookies)
+    try:
+        with open(path, "rb") as file:
+            if file.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+
+    # a unique temp file per write, so concurrent writers (threads, processes, Client and AsyncClient) never collide
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=f"{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _pack(keys, values):
+    """
+    Pairs endpoint parameter names with their values, dropping any that were not provided. Lists and tuples (e.g. of
+    `ids` or `fields`) are joined into the comma-separated form SysAid expects; the HTTP client does the url encoding.
+    """
+    return {k: ','.join(map(str, v)) if isinstance(v, (list, tuple)) else v
+            for k, v in zip(keys, values) if v is not None}
 
-        if (environment_name is None and base_url is None) or (environment_name and base_url):
-            raise ValueError('Must provide either environment_name or base_url, but not both')
-        
-        self.username = username
-        self.password = password
-        self.__cookie_dir = cookie_dir
-        if not os.path.isdir(cookie_dir):
-            logger.warning('cookie_dir not found, creating...')
-            os.makedirs(cookie_dir)
-            logger.info('successfully created cookie directory')
 
-        if cookie_file_name:
-            self.__cookie_path = os.path.join(self.__cookie_dir, cookie_file_name)
+def _info_payload(info):
+    """
+    Normalizes SR update fields, given as `key`/`value` dicts or `SRAttribute`s, into the list SysAid expects.
+    """
+    payload = []
+    append = payload.append
+    for field in info:
+        if isinstance(field, dict):
+            if 'key' not in field or 'value' not in field:
+                raise KeyError(f'Field dictionary must contain keys "key" and "value", {field.keys()}')
+            append({'key': field['key'], 'value': field['value']})
+        elif isinstance(field, SRAttribute):
+            append({'key': field.key, 'value': field.value})
         else:
-            self.__cookie_path = os.path.join(self.__cookie_dir, f"{self.username}_cookies.json")
+            raise TypeError(f'Info element must be a dict with keys `key` and `value` or an `SRAttribute`, not {type(field)}')
+    return payload
 
-        if environment_name:
-            self.base_url = f"https://{environment_name}.sysaidit.com/api/v1/"
-        
-        if base_url:
-            if not bool(re.match(PROTOCOL_RE_PATTERN, base_url)):
-                raise ValueError('base_url must include the http protocol (http:// or https://)')
-            self.base_url = f"{base_url.strip('/')}/api/v1/"
 
-        self.cookies = self.load_cookies()
+def _id_chunks(ids, size):
+    """
+    Splits SR ids (a single id or a list/tuple of str or int ids) into comma-separated strings of at most `size` ids.
+    """
+    if isinstance(ids, (list, tuple)):
+        ids = [str(i) for i in ids]
+    else:
+        ids = [str(ids)]
+    return [','.join(ids[i:i + size]) for i in range(0, len(ids), size)]
 
-        if not self.cookies:
-            self.login()
 
-    def __get_params(self, params):
-        return {k: v for k, v in params.items() if v is not None and k not in ENDPOINT_PARAM_IGNORE}
-    
+def _loads_or_none(content):
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _sr_list_result(data, format):
+    """
+    Turns a decoded SR list response into the requested format, or None if it is empty or not a list.
+    """
+    if not isinstance(data, list) or not data:
+        return None
+    if format == 'object':
+        from_response = ServiceRequest.from_response
+        return [from_response(sr) for sr in data]
+    return data
+
+
+class _BaseClient:
+    """
+    Credentials and cookie storage shared by `Client` and `AsyncClient`. The login body is serialized whenever the
+    username or password changes, so logging in never rebuilds it and never sends stale credentials.
+    """
+    __slots__ = ('_username', '_password', '_login_payload', '_cookie_path', '_logins')
+
+    def __init__(self, username, password, cookie_path):
+        self._username = username
+        self.password = password
+        self._cookie_path = cookie_path
+        # bumped on every login; a request that got a 401 compares it with the value it saw before sending, so when
+        # several fail at once only the first logs in again
+        self._logins = 0
+
+    @property
+    def username(self):
+        return self._username
+
+    @username.setter
+    def username(self, value):
+        self._username = value
+        self._login_payload = orjson.dumps({"user_name": value, "password": self._password})
+
+    @property
+    def password(self):
+        return self._password
+
+    @password.setter
+    def password(self, value):
+        self._password = value
+        self._login_payload = orjson.dumps({"user_name": self._username, "password": value})
+
     @property
     def cookie_path(self):
-        return self.__cookie_path
+        return self._cookie_path
 
     def load_cookies(self):
-        try:
-            with open(self.__cookie_path, "r") as file:
-                cookies = json.load(file)
-                return cookies
-        except FileNotFoundError:
-            return None
+        return _read_cookies(self._cookie_path)
 
     def save_cookies(self, cookies):
-        with open(self.__cookie_path, "w") as file:
-            json.dump(cookies, file)
+        _write_cookies(self._cookie_path, cookies)
+
+    def _stored_cookies(self):
+        "Cookies from this process's last login with the same cookie file, or else whatever the file holds (unverified)"
+        return _cookie_cache.get(os.path.abspath(self._cookie_path)) or self.load_cookies()
+
+    def _logged_in(self, cookies):
+        "Records the cookies of a successful login, in memory for clients created later and on disk for later runs"
+        self._logins += 1
+        if cookies:
+            _cookie_cache[os.path.abspath(self._cookie_path)] = cookies
+        self.save_cookies(cookies)
+
+
+class Client(_BaseClient):
+    """
+    Simple client that logs in, stores the necessary cookies, and uses those cookies to make requests against the API.
+    """
+    __slots__ = ('_Client__cookie_dir', 'base_url', '_session', '_login_url', '_sr_cache', '_sr_cache_size', '_sr_cache_ttl',
+                 '_sr_cache_lock', '_sr_cache_writes', '_login_lock')
+
+    def __init__(self, username, password, environment_name=None, base_url=None, cookie_dir='.', cookie_file_name=None,
+                 sr_cache_size=128, sr_cache_ttl=0):
+        """
+        `get_sr` keeps the last `sr_cache_size` SRs it fetched (0 disables this). Cached SRs are revalidated with their
+        ETag so unchanged SRs aren't re-downloaded, and for `sr_cache_ttl` seconds after a fetch are served without
+        contacting the server at all. Any write through this client to an SR drops it from the cache.
+        """
+
+        self.base_url = _resolve_base_url(environment_name, base_url)
+        self._login_url = f"{self.base_url}login"
+        super().__init__(username, password, _resolve_cookie_path(cookie_dir, username, cookie_file_name))
+        self.__cookie_dir = cookie_dir
+        self._sr_cache = OrderedDict()  # sr id -> (etag, response body, expires at)
+        self._sr_cache_size = sr_cache_size
+        self._sr_cache_ttl = sr_cache_ttl
+        self._sr_cache_lock = threading.Lock()
+        self._sr_cache_writes = 0  # bumped on every write to an SR, so a fetch that overlapped one isn't cached
+        self._login_lock = threading.Lock()
+
+        self._session = requests.Session()
+        self._session.headers.update(JSON_HEADERS)
+        retry = _JitteredRetry(total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504),
+                               allowed_methods=IDEMPOTENT_METHODS, respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        # SysAid only allows 2 logins per 5 minutes, so a throttled login backs off for longer (roughly 6 minutes
+        # in total) before giving up. Session.mount picks the longest matching prefix, so this only affects login.
+        login_retry = _JitteredRetry(total=8, backoff_factor=2, status_forcelist=(429,), allowed_methods=VALID_METHODS,
+                                     respect_retry_after_header=True, raise_on_status=False)
+        self._session.mount(self._login_url, HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=login_retry))
+
+        cookies = self._stored_cookies()
+        if cookies:
+            self._session.cookies.update(cookies)
+        else:
+            self.login()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._session.close()
+
+    @property
+    def cookies(self):
+        """
+        The session's current cookies. The session jar is the only copy, so this always reflects the latest login.
+        """
+        return self._session.cookies.get_dict()
 
     def login(self):
-        url = f"{self.base_url}login"
-        payload = {"user_name": self.username, "password": quote_plus(self.password)}
-        headers = { 'Content-Type': 'application/json' }
-
-        while True:
-            response = requests.post(url, data=orjson.dumps(payload), headers=headers)
-
-            if response.status_code == 200:
-                self.cookies = response.cookies.get_dict()
-                self.save_cookies(self.cookies)
-                break
-            elif response.status_code == 429:
-                print("Too many login requests. Retrying in 5 minutes.")
-                time.sleep(300)
-            else:
-                response.raise_for_status()
-
-    def make_request(self, method, endpoint, params=None, body=None, retry=False, files=None):
+        # 429s (too many logins) are retried by the session adapter, honoring Retry-After
+        response = self._session.post(self._login_url, data=self._login_payload)
+        response.raise_for_status()
+        self._logged_in(self._session.cookies.get_dict())
+
+    def make_request(self, method, endpoint, params=None, body=None, retry=False, files=None, raw=False, headers=None):
         """ 
         Issues a request given the parameters. Will attempt 1 retry if a 401 response (UnAuthorized)
-        after trying to log in again.
+        after trying to log in again. Any other failure raises `requests.HTTPError` carrying the response.
+
+        If `raw` is True the undecoded response body is returned as bytes, for callers that parse or forward it themselves.
+        `headers` are merged over the session defaults for this request only. Dicts and lists in `body` are serialized
+        to JSON bytes and str bodies are UTF-8 encoded; prefer passing the dict/list (or bytes) over a pre-built JSON
+        string. Anything else (bytes, a multipart encoder) is sent as-is.
+        """
+        response = self._send(method, endpoint, params=params, body=body, retry=retry, files=files, headers=headers)
+        if raw:
+            return response.content
+        # SysAid doesn't always label JSON bodies as such, so try to parse regardless of Content-Type
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return response.text
+
+    def _send(self, method, endpoint, params=None, body=None, retry=False, files=None, headers=None) -> requests.Response:
         """
-        headers = { 'Content-Type': 'application/json' }
-        if body:
-            if not isinstance(body, str):
-                body = orjson.dumps(body)
-        url = self.base_url + endpoint
-
-        req_params = {'cookies': self.cookies, 'headers': headers}
-        if params:
-            req_params['params'] = params
-        if body:
-            req_params['body'] = orjson.dumps(body)
+        Does the work of `make_request` up to decoding the body, returning the successful response itself. 304 only
+        answers conditional requests, so it is passed back for the caller to handle.
+        """
+        http_method = method.upper()
+        if http_method not in VALID_METHODS:
+            raise ValueError(f'Unknown method: {method}')
+        if isinstance(body, (dict, list)):
+            body = orjson.dumps(body)
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
         if files:
-            req_params['files'] = files
-
-        if method.lower() == 'get':
-            fn = requests.get
-        elif method.lower() == 'post':
-            fn = requests.post
-        elif method.lower() == 'put':
-            fn = requests.put
-        elif method.lower() == 'delete':
-            fn = requests.delete
+            # let requests set the multipart boundary instead of the session's JSON content type
+            headers = {'Content-Type': None, **(headers or {})}
+        url = f"{self.base_url}{endpoint}"
+        logins = self._logins
+
+        try:
+            response = self._session.request(http_method, url, params=params, data=body, files=files, headers=headers)
+        finally:
+            if http_method != 'GET' and self._sr_cache_size:
+                # dropped once the write is done (or failed part way), so no fetch from before it can repopulate it
+                self.__drop_cached_srs(endpoint, params)
+
+        status = response.status_code
+        if status == 200 or status == 304:
+            return response
+        if status == 401 and not retry:
+            with self._login_lock:
+                if self._logins == logins:
+                    self.login()
+            _rewind(body, files)
+            return self._send(method, endpoint, params=params, body=body, retry=True, files=files, headers=headers)
+        # only the start of the body goes in the message; the full response stays available on the exception
+        raise requests.HTTPError(f'SysAid API error {status}: {response.content[:512]!r}', response=response)
+
+    def __drop_cached_srs(self, endpoint, params):
+        "Drops the SRs a write to `endpoint` may have changed (sr/{id}/..., or the `ids` of a bulk delete) from the cache"
+        parts = endpoint.split('/', 2)
+        if parts[0] != 'sr':
+            return
+        if len(parts) > 1:
+            sr_ids = (parts[1],)
+        elif params and 'ids' in params:
+            sr_ids = str(params['ids']).split(',')
         else:
-            raise ValueError(f'Unknown method: {method}')
-        
-        response = fn(url, **req_params)
-
-        if response.status_code == 200:
-            try:
-                return response.json()
-            except Exception as e:
-                return response.text
-        elif response.status_code == 401:
-            if not retry:
-                self.login()
-                return self.make_request(method, endpoint, params, body, True, files)
-            else:
-                print(response.text)
-                raise Exception('Could not make authorized request')
+            return
+        with self._sr_cache_lock:
+            self._sr_cache_writes += 1
+            for sr_id in sr_ids:
+                self._sr_cache.pop(sr_id, None)
+
+    def __fetch_sr(self, sr_id):
+        """
+        Returns the decoded `sr/{sr_id}` response, going through the SR cache. Bodies are cached as bytes and decoded per
+        call, so callers never share (and mutate) the same dicts.
+        """
+        endpoint = f'sr/{sr_id}'
+        if not self._sr_cache_size:
+            return self.make_request('get', endpoint)
+
+        key = str(sr_id)
+        headers = None
+        with self._sr_cache_lock:
+            writes = self._sr_cache_writes
+            cached = self._sr_cache.get(key)
+            if cached:
+                etag, content, expires = cached
+                if expires > time.monotonic():
+                    self._sr_cache.move_to_end(key)
+                    return orjson.loads(content)
+                if etag:
+                    headers = {'If-None-Match': etag}
+
+        response = self._send('get', endpoint, headers=headers)
+        if response.status_code == 304:
+            etag, content = cached[0], cached[1]
         else:
-            print(response.text)
-            raise Exception('Could not make authorized request')
+            etag, content = response.headers.get('ETag'), response.content
+
+        try:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            with self._sr_cache_lock:
+                self._sr_cache.pop(key, None)
+            return response.text
+        if etag or self._sr_cache_ttl:
+            with self._sr_cache_lock:
+                if self._sr_cache_writes != writes:
+                    # an SR was written while this was in flight, so the body may predate it
+                    return data
+                self._sr_cache[key] = (etag, content, time.monotonic() + self._sr_cache_ttl)
+                self._sr_cache.move_to_end(key)
+                if len(self._sr_cache) > self._sr_cache_size:
+                    self._sr_cache.popitem(last=False)
+        return data
+
+    def get_srs(self, ids, max_workers=8, format: Literal['dict', 'object'] = 'object') -> dict:
+        """
+        Fetches many SRs concurrently with `get_sr` on a thread pool sharing this client's session, returning them keyed
+        by id in the order given. Throttled requests are retried by the session's retry policy; keep `max_workers` at
+        or below the connection pool size (64) so connections are reused rather than discarded.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {sr_id: executor.submit(self.get_sr, sr_id, format) for sr_id in ids}
+        return {sr_id: future.result() for sr_id, future in futures.items()}
 
     def get_sr(self, sr_id, format: Literal['dict', 'object'] = 'object') -> ServiceRequest|dict|None:
-        endpoint = f'sr/{sr_id}'
-        resp = self.make_request('get', endpoint)
+        resp = self.__fetch_sr(sr_id)
         if isinstance(resp, list):
             if len(resp):
                 sr = resp[0]
@@ -148,45 +480,36 @@ class Client:
 
     def get_sr_list(self, view=None, fields=None, ids=None, type=None, offset=None, limit=None, filters=None, 
                     sort=None, dir=None, format: Literal['dict', 'object'] = 'object') -> List[ServiceRequest|dict]|None:
-        params = self.__get_params(locals())
+        content = self.get_sr_list_raw(view, fields, ids, type, offset, limit, filters, sort, dir)
+        return _sr_list_result(_loads_or_none(content), format)
+
+    def get_sr_list_raw(self, view=None, fields=None, ids=None, type=None, offset=None, limit=None, filters=None,
+                        sort=None, dir=None) -> bytes:
+        """
+        Same as `get_sr_list` but returns the undecoded JSON body, skipping the parse entirely when the payload is only
+        being handed on (written to disk, passed to another orjson consumer, etc).
+        """
+        params = _pack(SR_LIST_PARAMS, (view, fields, ids, type, offset, limit, filters, sort, dir))
         endpoint = 'sr'
-        resp = self.make_request('get', endpoint, params=params)
-        if isinstance(resp, list):
-            if len(resp):
-                if format == 'object':
-                    return [ServiceRequest.from_response(sr) for sr in resp]
-                else:
-                    return resp
+        return self.make_request('get', endpoint, params=params, raw=True)
     
     def search_srs(self, query=None, view=None, fields=None, type=None, offset=None, limit=None, filters=None,
                    sort=None, dir=None, format: Literal['dict', 'object'] = 'object') -> List[ServiceRequest|dict]|None:
-        params = self.__get_params(locals())
+        params = _pack(SR_SEARCH_PARAMS, (query, view, fields, type, offset, limit, filters, sort, dir))
         endpoint = f'sr/search'
-        resp = self.make_request('get', endpoint, params=params)
-        if isinstance(resp, list):
-            if len(resp):
-                if format == 'object':
-                    return [ServiceRequest.from_response(sr) for sr in resp]
-                else:
-                    return resp
+        content = self.make_request('get', endpoint, params=params, raw=True)
+        return _sr_list_result(_loads_or_none(content), format)
         
-    def update_sr(self, id, info: List[dict[str, Any]]):
-        for field in info:
-            if isinstance(field, dict):
-                if 'key' not in field.keys() or 'value' not in field.keys(): 
-                    KeyError(f'Field dictionary must contain keys "key" and "value", {field.keys()}')
-            else:
-                TypeError(f'Info element must be a dict with keys `key` and `value` or an `SRAttribute`, not {type(field)}')
-
+    def update_sr(self, id, info: List[dict[str, Any]|SRAttribute]):
         payload =  {
           'id': id,
-          'info': info
+          'info': _info_payload(info)
         }
         endpoint = f'sr/{id}'
         return self.make_request('put', endpoint, body=payload)
     
     def count_srs(self, filters=None):
-        params = self.__get_params(locals())
+        params = _pack(('filters',), (filters,))
         endpoint = f"sr/count"
         return self.make_request('get', endpoint, params=params)
 
@@ -198,7 +521,7 @@ class Client:
         return self.make_request('post', endpoint, body=payload)
 
     def get_sr_template(self, view=None, fields=None, type=None, template_id=None):
-        params = self.__get_params(locals())
+        params = _pack(SR_TEMPLATE_PARAMS, (view, fields, type, template_id))
         endpoint = f"sr/template"
         return self.make_request('get', endpoint, params=params)
 
@@ -209,30 +532,29 @@ class Client:
         See documentatin available at: https://documentation.sysaid.com/docs/rest-api-details#create-service-request
         """
         INFO_ERROR = 'info must be a list of dictionaries with `key` and `value` fields'
-        if sr_type not in ('incident', 'request', 'problem', 'change', 'all'):
+        if sr_type not in SR_TYPES:
             raise ValueError(f'SR type must be one of: incident, request, problem, change, or all. Not {sr_type}')
         if not isinstance(info, list):
             raise TypeError(INFO_ERROR)
         for i, data in enumerate(info):
             if not isinstance(data, dict):
                 raise TypeError(INFO_ERROR)
-            if not data.get('key'):
-                raise KeyError(f'Error on info element {i}: missing key `key`')
-            if not data.get('value'):
-                raise KeyError(f'Error on info element {i}: missing key `key`')
-            
             key = data.get('key')
+            if not key:
+                raise KeyError(f'Error on info element {i}: missing key `key`')
             val = data.get('value')
+            if not val:
+                raise KeyError(f'Error on info element {i}: missing key `value`')
+
             if key == 'notes':
                 if not isinstance(val, dict):
                     raise TypeError('value for `notes` must be a dictionary with keys "userName", "createDate", and "text"')
-                if not isinstance(val['createDate'], int):
+                if not isinstance(val.get('createDate'), int):
                     raise TypeError('createDate note element must be an integer representing UTC date in milliseconds')
-            elif key == 'due_date':
-                if not isinstance(val, int):
-                     raise TypeError('due_date element must be an integer representing UTC date in milliseconds')
-            
-        params = self.__get_params(locals())
+            elif key == 'due_date' and not isinstance(val, int):
+                raise TypeError('due_date element must be an integer representing UTC date in milliseconds')
+
+        params = _pack(('view', 'type', 'template_id'), (view, sr_type, template_id))
 
         endpoint = 'sr'
         resp = self.make_request('post', endpoint, params=params, body=info)
@@ -242,12 +564,13 @@ class Client:
             return ServiceRequest.from_response(resp)
         raise TypeError(f'Unknown response type: {type(resp)}')
     
-    def delete_sr(self, ids):
-        if isinstance(ids, (list, tuple)):
-            ids = ','.join(ids)
-        params = {'ids': ids}
+    def delete_sr(self, ids, chunk_size=100) -> list:
+        """
+        Deletes one or more SRs. Long id lists are split into requests of `chunk_size` ids each to stay under url
+        length limits, so one response is returned per request.
+        """
         endpoint = 'sr'
-        return self.make_request('delete', endpoint, params=params)
+        return [self.make_request('delete', endpoint, params={'ids': chunk}) for chunk in _id_chunks(ids, chunk_size)]
     
     def add_sr_link(self, id, name, link):
         endpoint = f'sr/{id}/link'
@@ -260,13 +583,19 @@ class Client:
         return self.make_request('delete', endpoint, body=payload)
     
     def add_sr_attachment(self, id, file_path=None, file_data=None):
+        """
+        Uploads an attachment from either a path on disk or in-memory data. Files on disk are streamed when
+        requests-toolbelt is installed, otherwise requests reads the whole file into memory before sending.
+        """
+        endpoint = f'sr/{id}/attachment'
         if file_path:
-            files = {'file': open(file_path, 'rb')}
-        else:
-            files = {'file': file_data}
+            with open(file_path, 'rb') as file:
+                if MultipartEncoder is None:
+                    return self.make_request('post', endpoint, files={'file': file})
+                encoder = _RewindableUpload(os.path.basename(file_path), file)
+                return self.make_request('post', endpoint, body=encoder, headers={'Content-Type': encoder.content_type})
 
-        endpoint = f'sr/{id}/attachment'
-        return self.make_request('post', endpoint, files=files)
+        return self.make_request('post', endpoint, files={'file': file_data})
     
     def delete_sr_attachment(self, id, file_id):
         endpoint = f'sr/{id}/attachment'
@@ -274,8 +603,7 @@ class Client:
         return self.make_request('delete', endpoint, body=payload)
     
     def add_sr_activity(self, id, user_id: str, from_time: str, to_time: str, description:str):
-        payload = self.__get_params(locals())
-        del payload['id']
+        payload = _pack(('user_id', 'from_time', 'to_time', 'description'), (user_id, from_time, to_time, description))
         endpoint = f'sr/{id}/activity'
         return self.make_request('post', endpoint, body=payload)
 
@@ -292,6 +620,10 @@ class Client:
         The IDs of the users in the To and CC fields must be a comma-separated string, with users IDs. If there's a group, 
         the group ID should be surrounded by [ ].
 
+        With `file_path` the request is multipart: the message is sent as JSON in a part named `message`, next to a
+        `file` part. The SysAid documentation doesn't describe this form, so the `message` part is an assumption about
+        what the API accepts; without a file the message is sent as a plain JSON body.
+
         See documentation at: https://documentation.sysaid.com/docs/rest-api-details#send-message-from-service-request
         """
         # TODO: implement a message object
@@ -309,20 +641,23 @@ class Client:
         payload = {
             'message': message
         }
-        files = None
         if file_path:
-            files = {'file': open(file_path, 'rb')}
+            # a JSON body can't share a request with files, so the message goes as its own multipart part
+            files = {'message': (None, orjson.dumps(message), 'application/json')}
+            with open(file_path, 'rb') as file:
+                files['file'] = (os.path.basename(file_path), file)
+                return self.make_request('post', endpoint, params=params, files=files)
 
-        return self.make_request('post', endpoint, params=params, body=payload, files=files)
+        return self.make_request('post', endpoint, params=params, body=payload)
 
     def get_users_list(self, view=None, fields=None, type=None, offset=None, limit=None):
-        params = {k: v for k, v in locals().items() if v is not None}
+        params = _pack(USER_LIST_PARAMS, (view, fields, type, offset, limit))
         endpoint = f'users' 
         return self.make_request('get', endpoint, params=params)
 
     def get_user(self, id, view=None, fields=None):
         # TODO: implement a user object
-        params = {k: v for k, v in locals().items() if v is not None}
+        params = _pack(('view', 'fields'), (view, fields))
         endpoint = f'users/{id}' 
         return self.make_request('get', endpoint, params=params)
 
@@ -7,6 +7,8 @@ logger = getLogger(__name__)
 
 
 class SRAttribute:
+    __slots__ = ('_SRAttribute__data',)
+
     def __init__(self, data):
         self.__data = data
     
@@ -45,13 +47,17 @@ class SRAttribute:
 
 
 class ServiceRequest:
+    __slots__ = ('_ServiceRequest__id', '_ServiceRequest__can_update', '_ServiceRequest__can_delete',
+                 '_ServiceRequest__can_archive', '_ServiceRequest__has_children', '_ServiceRequest__info',
+                 '_ServiceRequest__client', '_ServiceRequest__auto_commit', '_ServiceRequest__pending_commits',
+                 '_ServiceRequest__info_keys')
+
     def __init__(self, id: int, can_update=True, can_delete=False, can_archive=False, has_children=False, info=[], client: Optional['Client'] =None, auto_commit=True):
         self.__id = id
         self.__can_update = can_update
         self.__can_delete = can_delete
         self.__can_archive = can_archive
         self.__has_children = has_children
-        self.__info = {}
         self.__client = client
         self.__auto_commit = auto_commit
         self.__pending_commits = {}
@@ -59,42 +65,65 @@ class ServiceRequest:
         if client is None:
             logger.warning('No client provided, SR is read-only')
 
-        for info_dict in info:
-            self.__info[info_dict['key']] = SRAttribute(info_dict)
+        # raw info dicts are kept as-is; `attribute()` wraps one in an SRAttribute on demand
+        self.__info = {info_dict['key']: info_dict for info_dict in info}
+        self.__info_keys = frozenset(self.__info)
 
-    def __getattribute__(self, __name: str) -> Any:
-        "Fetches an attribute either from the class spec or from within the info body"
-        try:
-            return super().__getattribute__(__name)
-        except AttributeError:
-            attr = self.__info.get(__name)
-            if attr:
-                return attr.value
-            raise AttributeError(f"SR {self.id} has no attribute '{__name}'. If the SR was created with limited fields, try re-creating without using the fields paramter")
+    def __getattr__(self, __name: str) -> Any:
+        "Fetches an attribute from within the info body, only called once normal attribute lookup has failed"
+        if __name.startswith('_ServiceRequest__'):
+            # an unset slot (e.g. mid-__init__), not an info field; looking in info here would recurse
+            raise AttributeError(__name)
+        attr = self.__info.get(__name)
+        if attr is not None:
+            return attr['value']
+        raise AttributeError(f"SR {getattr(self, '_ServiceRequest__id', None)} has no attribute '{__name}'. If the SR was created with limited fields, try re-creating without using the fields paramter")
 
     def __setattr__(self, name, value):
-        if name in self.__info.keys():
-            if not self.client:
+        # during __init__ the info fields don't exist yet, so every assignment falls through to a plain slot write
+        info_keys = getattr(self, '_ServiceRequest__info_keys', None)
+        if info_keys and name in info_keys:
+            client = self.__client
+            if not client:
                 raise AttributeError('SR is read-only, cannot modify values')
+            field = self.__info[name]
             if self.__auto_commit:
-                self.client.update_sr(self.__id, [{'key': name, 'value': value}])
+                client.update_sr(self.__id, [{'key': name, 'value': value}])
+                field['value'] = value
             else:
-                old = self.__info[name].value
-                self.__info[name].value = value
-                self.__pending_commits[name] = {'old': old, 'new': value}
+                pending = self.__pending_commits
+                # keep the original value across repeated edits so rollback restores what the server has
+                old = pending[name]['old'] if name in pending else field['value']
+                field['value'] = value
+                pending[name] = {'old': old, 'new': value}
         else:
             super().__setattr__(name, value)
         return True
 
     @classmethod
     def from_response(cls, data: dict):
-        return cls(id=int(data['id']),
-                   can_update=data['canUpdate'], 
-                   can_delete=data['canDelete'], 
-                   can_archive=data['canArchive'], 
-                   has_children=data['hasChildren'], 
-                   info=data['info'])
-    
+        "Builds a read-only SR from an API response. Fills the slots directly, skipping __init__ and __setattr__"
+        sr = cls.__new__(cls)
+        set_slot = object.__setattr__
+        info = {info_dict['key']: info_dict for info_dict in data['info']}
+        set_slot(sr, '_ServiceRequest__id', int(data['id']))
+        set_slot(sr, '_ServiceRequest__can_update', data['canUpdate'])
+        set_slot(sr, '_ServiceRequest__can_delete', data['canDelete'])
+        set_slot(sr, '_ServiceRequest__can_archive', data['canArchive'])
+        set_slot(sr, '_ServiceRequest__has_children', data['hasChildren'])
+        set_slot(sr, '_ServiceRequest__info', info)
+        set_slot(sr, '_ServiceRequest__info_keys', frozenset(info))
+        set_slot(sr, '_ServiceRequest__client', None)
+        set_slot(sr, '_ServiceRequest__auto_commit', True)
+        set_slot(sr, '_ServiceRequest__pending_commits', {})
+        return sr
+    
+    def attribute(self, name) -> SRAttribute:
+        "Returns the full info field (captions, value class, etc) for `name`, backed by the SR's own data"
+        if name not in self.__info_keys:
+            raise AttributeError(f'Field {name} not present in SR fields')
+        return SRAttribute(self.__info[name])
+
     @property
     def id(self):
         return self.__id
@@ -144,40 +173,45 @@ class ServiceRequest:
         logger.info('Client has been set, SR can now be modified')
 
     def commit(self):
-        if not self.client:
-                raise AttributeError('SR is read-only, cannot modify values')
+        client = self.__client
+        pending = self.__pending_commits
+        if not client:
+            raise AttributeError('SR is read-only, cannot modify values')
         if self.__auto_commit:
             logger.warning('SR is set to auto-commit, no pending changes.')
-        if not self.__pending_commits:
+        if not pending:
             logger.warning('No pending commits.')
-        
-        info: List[dict[str, Any]] = [{'key': k, 'value': v['new']} for k, v in self.__pending_commits.items()]
+            return True
+
+        info: List[dict[str, Any]] = [{'key': k, 'value': v['new']} for k, v in pending.items()]
         try:
-            self.client.update_sr(self.__id, info)
+            client.update_sr(self.__id, info)
         except Exception as e:
             logger.error('Could not perform update. Use `rollback()` to revert pending changes')
+            return False
+        pending.clear()
         return True
 
     def rollback(self, field:Optional[str]=None):
         if self.__auto_commit:
             logger.warning('SR is set to auto-commit, no pending changes.')
-        if not self.__pending_commits:
-            logger.warning('No pending commits.')
 
+        info = self.__info
+        pending = self.__pending_commits
         if field: 
-            if field not in self.__info.keys():
+            if field not in info:
                 raise AttributeError(f'Field {field} not present in SR fields')
-            if field not in self.__pending_commits.keys():
+            if field not in pending:
                 raise AttributeError(f'Field {field} does not having pending commits to rollback')
 
-            old = self.__pending_commits[field]['old']
-            self.__info[field].value = old
+            info[field]['value'] = pending.pop(field)['old']
             return True
 
-        if not self.__pending_commits:
+        if not pending:
             logger.warning('No pending commits to rollback')
-        
-        for field, values in self.__pending_commits.items():
-            old = values['old']
-            self.__info[field].value = old
+            return True
+
+        for field, values in pending.items():
+            info[field]['value'] = values['old']
+        pending.clear()
         return True
\ No newline at end of file
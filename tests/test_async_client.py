@@ -0,0 +1,120 @@
+import asyncio
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import orjson
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from pysysaid import AsyncClient
+
+
+class FakeSysAid(BaseHTTPRequestHandler):
+    """
+    Minimal SysAid API: login sets a session cookie, requests without it get a 401, and every other request is
+    answered with the next status in `server.statuses` (200 once they run out). Throttled responses carry
+    `Retry-After: 0` so retries don't slow the tests down.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b'{}', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split('?')[0]
+        if path == '/api/v1/login':
+            server.logins += 1
+            return self._reply(200, headers={'Set-Cookie': 'JSESSIONID=session; Path=/'})
+        if 'JSESSIONID=session' not in (self.headers.get('Cookie') or ''):
+            return self._reply(401)
+
+        server.requests.append(self.command)
+        status = server.statuses.pop(0) if server.statuses else 200
+        if status == 429:
+            return self._reply(429, headers={'Retry-After': '0'})
+        if status != 200:
+            return self._reply(status)
+        sr_id = path.rsplit('/', 1)[-1]
+        info = [{'key': 'title', 'value': 'title', 'valueClass': '', 'valueCaption': '', 'keyCaption': ''}]
+        return self._reply(200, orjson.dumps([{'id': sr_id, 'canUpdate': True, 'canDelete': False, 'canArchive': False,
+                                               'hasChildren': False, 'info': info}]))
+
+    do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSysAid)
+    server.requests = []
+    server.statuses = []
+    server.logins = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, tmp_path):
+    # a fresh cookie file and username per test, so the process-wide cookie cache is never shared between tests
+    return AsyncClient(tmp_path.name, 'password', base_url=f'http://127.0.0.1:{server.server_address[1]}',
+                       cookie_dir=str(tmp_path))
+
+
+def run(server, tmp_path, method, endpoint):
+    async def request():
+        async with make_client(server, tmp_path) as client:
+            return await client.make_request(method, endpoint, body={})
+    return asyncio.run(request())
+
+
+def test_throttled_post_is_retried(server, tmp_path):
+    server.statuses = [429]
+    run(server, tmp_path, 'post', 'sr/1/close')
+
+    assert server.requests == ['POST', 'POST']
+
+
+def test_gateway_error_on_post_is_not_retried(server, tmp_path):
+    server.statuses = [503]
+    with pytest.raises(aiohttp.ClientResponseError) as error:
+        run(server, tmp_path, 'post', 'sr/1/close')
+
+    assert error.value.status == 503
+    assert server.requests == ['POST']
+
+
+@pytest.mark.parametrize('method', ['get', 'put', 'delete'])
+def test_gateway_error_on_idempotent_method_is_retried(server, tmp_path, method):
+    server.statuses = [502]
+    run(server, tmp_path, method, 'sr/1')
+
+    assert server.requests == [method.upper()] * 2
+
+
+def test_concurrent_401s_log_in_once(server, tmp_path):
+    with open(os.path.join(tmp_path, f'{tmp_path.name}_cookies.json'), 'wb') as file:
+        file.write(orjson.dumps({'JSESSIONID': 'stale'}))
+
+    async def fetch():
+        async with make_client(server, tmp_path) as client:
+            return await client.get_srs_bulk([1, 2, 3, 4, 5, 6], format='dict')
+
+    srs = asyncio.run(fetch())
+
+    assert [sr['id'] for sr in srs] == ['1', '2', '3', '4', '5', '6']
+    assert server.logins == 1
@@ -0,0 +1,138 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import orjson
+import pytest
+
+from pysysaid import Client
+
+
+class FakeSysAid(BaseHTTPRequestHandler):
+    """
+    Minimal SysAid API: login sets a session cookie, `sr/{id}` serves the SR with an ETag (answering a matching
+    If-None-Match with 304), and a PUT to `sr/{id}` changes its title and ETag.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split('?')[0]
+        if path == '/api/v1/login':
+            return self._reply(200, b'{}', {'Set-Cookie': 'JSESSIONID=session; Path=/'})
+
+        sr_id = path.rsplit('/', 1)[-1]
+        server.requests.append((self.command, sr_id, self.headers.get('If-None-Match')))
+        if self.command == 'PUT':
+            server.version += 1
+            return self._reply(200, b'{}')
+
+        version = server.version
+        if server.hold_get is not None:
+            server.get_started.set()
+            server.hold_get.wait(5)
+        etag = f'"v{version}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self._reply(304)
+        info = [{'key': 'title', 'value': f'title v{version}', 'valueClass': '', 'valueCaption': '', 'keyCaption': ''}]
+        body = orjson.dumps([{'id': sr_id, 'canUpdate': True, 'canDelete': False, 'canArchive': False,
+                              'hasChildren': False, 'info': info}])
+        return self._reply(200, body, {'ETag': etag})
+
+    do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSysAid)
+    server.requests = []
+    server.version = 1
+    server.hold_get = None
+    server.get_started = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, tmp_path, **kwargs):
+    # a fresh cookie file and username per test, so the process-wide cookie cache is never shared between tests
+    return Client(tmp_path.name, 'password', base_url=f'http://127.0.0.1:{server.server_address[1]}',
+                  cookie_dir=str(tmp_path), **kwargs)
+
+
+def test_revalidates_with_etag(server, tmp_path):
+    with make_client(server, tmp_path) as client:
+        first = client.get_sr(1, format='dict')
+        second = client.get_sr(1, format='dict')
+
+    assert first == second
+    assert server.requests == [('GET', '1', None), ('GET', '1', '"v1"')]
+
+
+def test_ttl_skips_the_server(server, tmp_path):
+    with make_client(server, tmp_path, sr_cache_ttl=60) as client:
+        client.get_sr(1)
+        client.get_sr(1)
+
+    assert server.requests == [('GET', '1', None)]
+
+
+def test_cache_disabled(server, tmp_path):
+    with make_client(server, tmp_path, sr_cache_size=0, sr_cache_ttl=60) as client:
+        client.get_sr(1)
+        client.get_sr(1)
+
+    assert server.requests == [('GET', '1', None), ('GET', '1', None)]
+
+
+def test_write_invalidates(server, tmp_path):
+    with make_client(server, tmp_path, sr_cache_ttl=60) as client:
+        client.get_sr(1)
+        client.update_sr(1, [{'key': 'title', 'value': 'title v2'}])
+        sr = client.get_sr(1)
+
+    assert sr.title == 'title v2'
+    assert server.requests[-1] == ('GET', '1', None)
+
+
+def test_bulk_delete_invalidates(server, tmp_path):
+    with make_client(server, tmp_path, sr_cache_ttl=60) as client:
+        client.get_sr(1)
+        client.get_sr(2)
+        client.delete_sr([1, 2])
+        client.get_sr(1)
+        client.get_sr(2)
+
+    assert server.requests[-2:] == [('GET', '1', None), ('GET', '2', None)]
+
+
+def test_fetch_overlapping_a_write_is_not_cached(server, tmp_path):
+    with make_client(server, tmp_path, sr_cache_ttl=60) as client:
+        server.hold_get = threading.Event()
+        fetch = threading.Thread(target=client.get_sr, args=(1,))
+        fetch.start()
+        assert server.get_started.wait(5)
+        # the in-flight fetch has read version 1; the write lands before its response does
+        client.update_sr(1, [{'key': 'title', 'value': 'title v2'}])
+        server.hold_get.set()
+        fetch.join()
+        server.hold_get = None
+
+        sr = client.get_sr(1)
+
+    assert sr.title == 'title v2'
@@ -0,0 +1,127 @@
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import orjson
+import pytest
+
+from pysysaid import Client
+from pysysaid import client as client_module
+
+ATTACHMENT = b'attachment body\n' * 4096
+
+
+class FakeSysAid(BaseHTTPRequestHandler):
+    """
+    Minimal SysAid API: login sets a session cookie and every other request is recorded as (path, headers, body). The
+    first `server.reject` requests after login are answered with a 401, as if the session had expired.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def _handle(self):
+        server = self.server
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        path = self.path.split('?')[0]
+        if path == '/api/v1/login':
+            server.logins += 1
+            return self._reply(200, {'Set-Cookie': 'JSESSIONID=session; Path=/'})
+
+        server.requests.append((path, self.headers, body))
+        if server.reject:
+            server.reject -= 1
+            return self._reply(401)
+        return self._reply(200)
+
+    do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSysAid)
+    server.requests = []
+    server.reject = 0
+    server.logins = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, tmp_path):
+    # a fresh cookie file and username per test, so the process-wide cookie cache is never shared between tests
+    with Client(tmp_path.name, 'password', base_url=f'http://127.0.0.1:{server.server_address[1]}',
+                cookie_dir=str(tmp_path)) as client:
+        yield client
+
+
+@pytest.fixture
+def attachment(tmp_path):
+    path = tmp_path / 'report.txt'
+    path.write_bytes(ATTACHMENT)
+    return str(path)
+
+
+def multipart_parts(headers, body):
+    "Decodes a multipart request body into {part name: (filename, content type, payload bytes)}"
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {headers['Content-Type']}\r\n\r\n".encode() + body)
+    return {part.get_param('name', header='content-disposition'): (part.get_filename(), part.get_content_type(),
+                                                                   part.get_payload(decode=True))
+            for part in message.iter_parts()}
+
+
+@pytest.mark.parametrize('streamed', [False, True], ids=['buffered', 'streamed'])
+def test_attachment_resent_in_full_after_relogin(server, client, attachment, monkeypatch, streamed):
+    if streamed and client_module.MultipartEncoder is None:
+        pytest.skip('streaming uploads need requests-toolbelt')
+    if not streamed:
+        monkeypatch.setattr(client_module, 'MultipartEncoder', None)
+    server.reject = 1
+
+    client.add_sr_attachment(1, file_path=attachment)
+
+    assert server.logins == 2
+    assert len(server.requests) == 2
+    first, resent = (multipart_parts(headers, body) for _, headers, body in server.requests)
+    assert resent == first
+    assert resent['file'][0] == 'report.txt'
+    assert resent['file'][2] == ATTACHMENT
+
+
+def test_message_with_file_is_sent_as_multipart(server, client, attachment):
+    client.send_sr_message(1, '1', '2,[3]', '', 'Subject', 'Body', file_path=attachment)
+
+    path, headers, body = server.requests[-1]
+    parts = multipart_parts(headers, body)
+    assert path == '/api/v1/sr/1/message'
+    assert set(parts) == {'message', 'file'}
+    assert parts['message'][1] == 'application/json'
+    assert orjson.loads(parts['message'][2]) == {'fromUserId': '1', 'toUsers': '2,[3]', 'ccUsers': '',
+                                                 'msgSubject': 'Subject', 'msgBody': 'Body'}
+    assert parts['file'][0] == 'report.txt'
+    assert parts['file'][2] == ATTACHMENT
+
+
+def test_message_with_file_resent_in_full_after_relogin(server, client, attachment):
+    server.reject = 1
+
+    client.send_sr_message(1, '1', '2', '', 'Subject', 'Body', file_path=attachment)
+
+    assert len(server.requests) == 2
+    first, resent = (multipart_parts(headers, body) for _, headers, body in server.requests)
+    assert resent == first
+    assert resent['file'][2] == ATTACHMENT